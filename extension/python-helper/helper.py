@@ -1,10 +1,107 @@
-import argparse
 import importlib.metadata
 import json
 import sys
 
 from identifier import identify_at_position
-from resolver import get_docstring_from_file, get_docstring_from_source, resolve_symbol
+from resolver import (
+    clear_caches,
+    forget_failures,
+    get_docstring_from_file,
+    get_docstring_from_source,
+    resolve_symbol,
+    resolve_symbols,
+)
+
+
+def _json_dumps(obj) -> bytes:
+    return json.dumps(obj).encode("utf-8")
+
+
+# orjson is optional — it is noticeably faster on the multi-KB docstring payloads
+# resolve returns, but the helper runs in the user's interpreter, so fall back to
+# the stdlib encoder when it isn't installed.
+try:
+    import orjson
+
+    # orjson refuses lone surrogates in both directions: surrogateescape-decoded
+    # text or C-extension docstrings on the way out, and the "\ud800" escapes
+    # JSON.stringify emits for unpaired UTF-16 in a source on the way in. json
+    # handles both, so retry just that payload with it.
+    def _dumps(obj) -> bytes:
+        try:
+            return orjson.dumps(obj)
+        except orjson.JSONEncodeError:
+            return _json_dumps(obj)
+
+    def _loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return json.loads(data)
+
+except ImportError:
+    _dumps = _json_dumps
+    _loads = json.loads
+
+
+# Invariant for the life of the process, so build (and serialize) it once.
+_VERSION_INFO = {
+    "version": f"{sys.version_info.major}.{sys.version_info.minor}",
+    "full_version": sys.version,
+}
+_VERSION_INFO_JSON = _dumps(_VERSION_INFO)
+
+
+def _write(data: bytes) -> None:
+    """Write one serialized JSON document followed by a newline and flush it."""
+    sys.stdout.buffer.write(data + b"\n")
+    sys.stdout.buffer.flush()
+
+
+def _handle_request(req: dict):
+    """Run a single server request and return its result payload."""
+    cmd = req.get("cmd")
+
+    if cmd == "resolve":
+        return resolve_symbol(req["symbol"])
+    if cmd == "resolve_many":
+        return resolve_symbols(req["symbols"])
+    if cmd == "get_docstring":
+        return get_docstring_from_source(req["source"], req["symbol"])
+    if cmd == "resolve_source_symbol":
+        return get_docstring_from_file(
+            req["file_path"],
+            req.get("candidates") or [],
+            req.get("module"),
+        )
+    if cmd == "identify":
+        return {"type": identify_at_position(req["source"], req["line"], req["col"])}
+    if cmd == "version_info":
+        return _VERSION_INFO
+    if cmd == "clear_cache":
+        clear_caches()
+        return None
+    if cmd == "forget_failures":
+        forget_failures()
+        return None
+    if cmd == "pkg_version":
+        pkg = req.get("package", "")
+        try:
+            return {"version": importlib.metadata.version(pkg)}
+        except Exception:
+            return {"version": None}
+
+    raise ValueError(f"Unknown command: {cmd}")
+
+
+def _respond(req: dict) -> bytes:
+    """Handle one request and return its serialized response line."""
+    req_id = 0
+    try:
+        req_id = req.get("id", 0)
+        return _dumps({"id": req_id, "result": _handle_request(req)})
+    except Exception as e:
+        return _dumps({"id": req_id, "error": str(e)})
 
 
 def server_mode():
@@ -12,66 +109,65 @@ def server_mode():
     Persistent IPC server — reads newline-delimited JSON requests from stdin,
     writes newline-delimited JSON responses to stdout.
 
+    The process lives for the whole editor session, so imported modules and
+    any module-level caches in identifier/resolver are shared across requests.
+
     Request format:
         {"id": <int>, "cmd": "resolve",       "symbol": "<name>"}
+        {"id": <int>, "cmd": "resolve_many",  "symbols": ["<name>", ...]}
         {"id": <int>, "cmd": "identify",      "source": "<src>", "line": <n>, "col": <n>}
         {"id": <int>, "cmd": "version_info"}
+        {"id": <int>, "cmd": "clear_cache"}
+        {"id": <int>, "cmd": "forget_failures"}
+        {"cmd": "batch", "requests": [<request>, ...]}
 
     Response format (success):
         {"id": <int>, "result": <any>}
     Response format (error):
         {"id": <int>, "error": "<message>"}
+
+    resolve_many answers with one result object keyed by symbol name; each value
+    is what "resolve" would return for that name.
+
+    A batch is answered with one response line per contained request (each
+    carrying its own id), each written as soon as that request finishes.
     """
-    for raw in sys.stdin:
+    # Read raw bytes: the extension always writes UTF-8, whatever the locale's
+    # default text encoding is, and both JSON decoders accept bytes directly.
+    for raw in sys.stdin.buffer:
         raw = raw.strip()
         if not raw:
             continue
 
-        req_id = 0
         try:
-            req = json.loads(raw)
-            req_id = req.get("id", 0)
-            cmd = req.get("cmd")
-
-            if cmd == "resolve":
-                result = resolve_symbol(req["symbol"])
-            elif cmd == "get_docstring":
-                result = get_docstring_from_source(req["source"], req["symbol"])
-            elif cmd == "resolve_source_symbol":
-                result = get_docstring_from_file(
-                    req["file_path"],
-                    req.get("candidates") or [],
-                    req.get("module"),
-                )
-            elif cmd == "identify":
-                result = identify_at_position(req["source"], req["line"], req["col"])
-                result = {"type": result}
-            elif cmd == "version_info":
-                result = {
-                    "version": f"{sys.version_info.major}.{sys.version_info.minor}",
-                    "full_version": sys.version,
-                }
-            elif cmd == "pkg_version":
-                pkg = req.get("package", "")
-                try:
-                    result = {"version": importlib.metadata.version(pkg)}
-                except Exception:
-                    result = {"version": None}
-            else:
-                result = None
-                print(
-                    json.dumps({"id": req_id, "error": f"Unknown command: {cmd}"}),
-                    flush=True,
-                )
-                continue
-
-            print(json.dumps({"id": req_id, "result": result}), flush=True)
-
+            req = _loads(raw)
         except Exception as e:
-            print(json.dumps({"id": req_id, "error": str(e)}), flush=True)
+            _write(_dumps({"id": 0, "error": str(e)}))
+            continue
+
+        if isinstance(req, dict) and req.get("cmd") == "batch":
+            # Flush each answer as soon as it is ready: a slow resolve (cold
+            # import) must not hold back the cheap identify batched with it.
+            for sub in req.get("requests") or []:
+                _write(_respond(sub))
+        else:
+            _write(_respond(req))
 
 
 def main():
+    argv = sys.argv[1:]
+
+    # The extension only ever launches these two forms, so dispatch them without
+    # importing argparse (and its gettext/textwrap/shutil imports) on startup.
+    if argv == ["--server"]:
+        server_mode()
+        return
+    if len(argv) == 2 and argv[0] == "--resolve":
+        _write(_dumps(resolve_symbol(argv[1])))
+        return
+
+    import argparse
+
     parser = argparse.ArgumentParser(description="Python Helper for PyHover")
     parser.add_argument("--resolve", help="Resolve a symbol to its documentation")
     parser.add_argument(
@@ -95,19 +191,12 @@ def main():
         return
 
     if args.version_info:
-        print(
-            json.dumps(
-                {
-                    "version": f"{sys.version_info.major}.{sys.version_info.minor}",
-                    "full_version": sys.version,
-                }
-            )
-        )
+        _write(_VERSION_INFO_JSON)
         return
 
     if args.identify:
         if args.line is None or args.column is None:
-            print(json.dumps({"error": "Missing arguments for identification"}))
+            _write(_dumps({"error": "Missing arguments for identification"}))
             return
 
         try:
@@ -115,17 +204,16 @@ def main():
                 with open(args.file, "r", encoding="utf-8") as f:
                     source = f.read()
             else:
-                source = sys.stdin.read()
+                source = sys.stdin.buffer.read().decode("utf-8")
 
             result = identify_at_position(source, args.line, args.column)
-            print(json.dumps({"type": result}))
+            _write(_dumps({"type": result}))
         except Exception as e:
-            print(json.dumps({"error": str(e)}))
+            _write(_dumps({"error": str(e)}))
         return
 
     if args.resolve:
-        result = resolve_symbol(args.resolve)
-        print(json.dumps(result))
+        _write(_dumps(resolve_symbol(args.resolve)))
 
 
 if __name__ == "__main__":
@@ -3,6 +3,7 @@ import builtins as py_builtins
 import io
 import keyword
 import tokenize
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -15,6 +16,14 @@ class InferenceContext:
     class_attrs: dict[str, dict[str, str]] = field(default_factory=dict)
 
 
+@dataclass
+class ParsedSource:
+    """A parsed document plus the per-tree state derived from it."""
+    tree: ast.Module
+    context: InferenceContext
+    tokens_by_line: dict[int, list[tokenize.TokenInfo]] | None = None
+
+
 COPY_METHODS = {"copy", "__copy__", "__deepcopy__"}
 
 # Well-known lowercase *factory functions* whose return type isn't the
@@ -36,9 +45,12 @@ KNOWN_FACTORY_RETURN_TYPES: dict[tuple[str, str], str] = {
 
 
 def _infer_factory_return_type(owner: str, attr: str) -> str | None:
-    owner_root = owner.split(".")[0]
+    owner_root = owner.partition(".")[0]
     return KNOWN_FACTORY_RETURN_TYPES.get((owner_root, attr))
 SOFT_KEYWORDS = {"match", "case"}
+# Hard keywords (None/True/False included) plus soft keywords, checked with a
+# single set lookup per keyword token.
+_KEYWORDS = frozenset(keyword.kwlist) | SOFT_KEYWORDS
 BUILTIN_NAMES = set(dir(py_builtins))
 GLOBAL_NAME_TYPES: dict[str, str] = {
     "__file__": "str",
@@ -48,28 +60,51 @@ GLOBAL_NAME_TYPES: dict[str, str] = {
     "__annotations__": "dict",
 }
 
+# Recently parsed sources, keyed by the source text itself. Consecutive hovers in
+# an unchanged document send identical text, so they skip ast.parse and the
+# inference pass entirely. Kept small because a large module's AST is heavy.
+PARSE_CACHE_MAX = 8
+_parse_cache: "OrderedDict[str, ParsedSource | None]" = OrderedDict()
+
+
+def _parse_source(source: str) -> ParsedSource | None:
+    """Parse `source` (or reuse a cached parse); None if it has a syntax error."""
+    if source in _parse_cache:
+        _parse_cache.move_to_end(source)
+        return _parse_cache[source]
+
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        parsed = None
+    else:
+        parsed = ParsedSource(tree, _build_inference_context(tree))
+
+    _parse_cache[source] = parsed
+    if len(_parse_cache) > PARSE_CACHE_MAX:
+        _parse_cache.popitem(last=False)
+    return parsed
+
 
 def identify_at_position(source: str, line: int, col: int) -> str | None:
     """
     Identifies the Python construct at the given line and column.
     line is 1-based, col is 0-based.
     """
-    try:
-        tree = ast.parse(source)
-    except SyntaxError:
+    parsed = _parse_source(source)
+    if parsed is None:
         return None
 
-    keyword_token = _token_at_position(source, line, col)
+    if parsed.tokens_by_line is None:
+        parsed.tokens_by_line = _index_tokens(source)
+    keyword_token = _token_at_position(parsed.tokens_by_line, line, col)
     if keyword_token:
         token_value = keyword_token.string
-        if (
-            keyword.iskeyword(token_value) or token_value in SOFT_KEYWORDS
-        ) and token_value not in {"None", "True", "False"}:
-            return token_value
-        if token_value in {"None", "True", "False"}:
+        if token_value in _KEYWORDS:
             return token_value
 
-    context = _build_inference_context(tree)
+    tree = parsed.tree
+    context = parsed.context
 
     if keyword_token and keyword_token.type == tokenize.NAME:
         token_value = keyword_token.string
@@ -81,88 +116,118 @@ def identify_at_position(source: str, line: int, col: int) -> str | None:
         if token_value in BUILTIN_NAMES:
             return token_value
 
-    target_node = _find_target_node(tree, line, col)
-    if not target_node:
+    found = _find_target_node(tree, line, col)
+    if not found:
         return None
+    _size, target_node, ancestors = found
 
     # ast.Expr is a statement wrapper (e.g. a bare expression on its own line).
     # It has the exact same bounds as its child, so unwrap it to get the real expression.
     if isinstance(target_node, ast.Expr):
+        ancestors = [*ancestors, target_node]
         target_node = target_node.value
 
-    parents = _build_parent_map(tree)
-    return _map_node_to_type(target_node, parents, context)
+    return _map_node_to_type(target_node, ancestors, context)
 
 
-def _build_parent_map(tree: ast.Module) -> dict[ast.AST, ast.AST]:
-    """Build a mapping from each AST node to its parent."""
-    parents: dict[ast.AST, ast.AST] = {}
-    for node in ast.walk(tree):
-        for _field, value in ast.iter_fields(node):
-            if isinstance(value, list):
-                for item in value:
-                    if isinstance(item, ast.AST):
-                        parents[item] = node
-            elif isinstance(value, ast.AST):
-                parents[value] = node
-    return parents
+def _node_span(node: ast.AST) -> tuple[int, int, int, int] | None:
+    """Return (start_line, start_col, end_line, end_col), or None if unpositioned."""
+    start_line = getattr(node, "lineno", None)
+    end_line = getattr(node, "end_lineno", None)
+    start_col = getattr(node, "col_offset", None)
+    end_col = getattr(node, "end_col_offset", None)
+    if start_line is None or end_line is None or start_col is None or end_col is None:
+        return None
+    return start_line, start_col, end_line, end_col
 
 
-def _find_target_node(tree: ast.Module, line: int, col: int) -> ast.AST | None:
-    """Find the smallest AST node containing the given line/col position."""
-    target_node: ast.AST | None = None
-    min_range = float("inf")
+def _span_contains(span: tuple[int, int, int, int], line: int, col: int) -> bool:
+    start_line, start_col, end_line, end_col = span
+    if line < start_line or line > end_line:
+        return False
+    if line == start_line and col < start_col:
+        return False
+    if line == end_line and col > end_col:
+        return False
+    return True
 
-    for node in ast.walk(tree):
-        start_line = getattr(node, "lineno", None)
-        end_line = getattr(node, "end_lineno", None)
-        start_col = getattr(node, "col_offset", None)
-        end_col = getattr(node, "end_col_offset", None)
-        if None in (start_line, end_line, start_col, end_col):
-            continue
 
-        # At this point, all four values are guaranteed non-None.
-        assert start_line is not None
-        assert end_line is not None
-        assert start_col is not None
-        assert end_col is not None
+def _find_target_node(
+    tree: ast.AST, line: int, col: int
+) -> tuple[int, ast.AST, list[ast.AST]] | None:
+    """
+    Find the smallest AST node under `tree` containing the given line/col position.
 
-        start_line_int = int(start_line)
-        end_line_int = int(end_line)
-        start_col_int = int(start_col)
-        end_col_int = int(end_col)
+    Only subtrees whose range covers the cursor are descended into, so the work is
+    proportional to the depth of the tree rather than its size. The walk keeps an
+    explicit stack so deeply nested expressions (long ``a + b + ...`` chains,
+    ``elif`` ladders) can't hit the recursion limit. Returns the node's size, the
+    node itself and its ancestor chain (root first).
+    """
+    best: tuple[int, ast.AST, list[ast.AST]] | None = None
+    # (node, its ancestors), popped in pre-order so that on equal sizes the
+    # first node in source order wins.
+    stack = [(child, [tree]) for child in reversed(list(ast.iter_child_nodes(tree)))]
+
+    while stack:
+        node, ancestors = stack.pop()
+        span = _node_span(node)
+        if span is not None:
+            if _span_contains(span, line, col):
+                start_line, start_col, end_line, end_col = span
+                size = (end_line - start_line) * 10000 + (end_col - start_col)
+                if best is None or size < best[0]:
+                    best = (size, node, ancestors)
+            elif not _decorators_contain(node, line, col):
+                continue
+        # Unpositioned nodes (arguments, comprehension, withitem, match_case, ...)
+        # are transparent: their children may still contain the cursor.
+        child_ancestors = [*ancestors, node]
+        stack.extend(
+            (child, child_ancestors)
+            for child in reversed(list(ast.iter_child_nodes(node)))
+        )
 
-        if line < start_line_int or line > end_line_int:
-            continue
-        if line == start_line_int and col < start_col_int:
-            continue
-        if line == end_line_int and col > end_col_int:
-            continue
+    return best
 
-        size = (end_line_int - start_line_int) * 10000 + (end_col_int - start_col_int)
-        if size < min_range:
-            min_range = size
-            target_node = node
 
-    return target_node
+def _decorators_contain(node: ast.AST, line: int, col: int) -> bool:
+    """Decorators sit above a def/class's own range, so check them separately."""
+    for decorator in getattr(node, "decorator_list", None) or ():
+        span = _node_span(decorator)
+        if span is not None and _span_contains(span, line, col):
+            return True
+    return False
 
 
-def _token_at_position(source: str, line: int, col: int) -> Any:
-    cursor_line = line - 1
+def _index_tokens(source: str) -> dict[int, list[tokenize.TokenInfo]]:
+    """
+    Group the source's tokens by their (1-based) start line.
+
+    Built once per cached source, so each hover only scans the tokens of its own
+    line. Lines are not tokenized in isolation because a line inside a
+    triple-quoted string would then read as code.
+    """
+    tokens_by_line: dict[int, list[tokenize.TokenInfo]] = {}
     try:
         for token in tokenize.generate_tokens(io.StringIO(source).readline):
-            if token.start[0] - 1 != cursor_line:
-                continue
-
-            start_col = token.start[1]
-            end_col = token.end[1]
-            if start_col <= col < end_col:
-                return token
+            tokens_by_line.setdefault(token.start[0], []).append(token)
     except (tokenize.TokenError, IndentationError):
-        return None
+        # Keep the tokens produced before the error, as a streaming scan would.
+        pass
+    return tokens_by_line
+
+
+def _token_at_position(
+    tokens_by_line: dict[int, list[tokenize.TokenInfo]], line: int, col: int
+) -> tokenize.TokenInfo | None:
+    for token in tokens_by_line.get(line, ()):
+        if token.start[1] <= col < token.end[1]:
+            return token
+    return None
 
 
-def _map_literal_type(node: ast.AST, parents: dict[ast.AST, ast.AST]) -> str | None:
+def _map_literal_type(node: ast.AST, ancestors: list[ast.AST]) -> str | None:
     """Return the type string for literal AST nodes."""
     if isinstance(node, (ast.List, ast.ListComp)):
         return "list"
@@ -176,15 +241,14 @@ def _map_literal_type(node: ast.AST, parents: dict[ast.AST, ast.AST]) -> str | N
         return "f-string"
 
     if isinstance(node, ast.Constant):
-        return _infer_constant_value(node.value, parents, node)
+        return _infer_constant_value(node.value, ancestors)
 
     return None
 
 
 def _infer_constant_value(
     value: Any,
-    parents_map: dict[ast.AST, ast.AST] | None = None,
-    node: ast.AST | None = None,
+    ancestors: list[ast.AST] | None = None,
 ) -> str | None:
     """Infer the type string for a constant value."""
     if isinstance(value, bool):
@@ -202,10 +266,10 @@ def _infer_constant_value(
     if value is ...:
         return "Ellipsis"
     if isinstance(value, str):
-        if parents_map is not None and node is not None:
-            parent = parents_map.get(node)  # ast.Expr wrapper
+        if ancestors and len(ancestors) >= 2:
+            parent = ancestors[-1]  # ast.Expr wrapper
             if isinstance(parent, ast.Expr):
-                grandparent = parents_map.get(parent)
+                grandparent = ancestors[-2]
                 if (
                     isinstance(
                         grandparent,
@@ -226,12 +290,12 @@ def _infer_constant_value(
 
 
 def _map_node_to_type(
-    node: ast.AST, parents: dict[ast.AST, ast.AST], context: InferenceContext
+    node: ast.AST, ancestors: list[ast.AST], context: InferenceContext
 ) -> str | None:
     if isinstance(node, ast.alias):
         return node.name
 
-    literal_type = _map_literal_type(node, parents)
+    literal_type = _map_literal_type(node, ancestors)
     if literal_type:
         return literal_type
 
@@ -258,9 +322,7 @@ def _map_node_to_type(
     # Class Definitions
     if isinstance(node, ast.ClassDef):
         name = node.name
-        curr = node
-        while curr in parents:
-            curr = parents[curr]
+        for curr in reversed(ancestors):
             if isinstance(curr, ast.ClassDef):
                 name = f"{curr.name}.{name}"
         return name
@@ -268,9 +330,7 @@ def _map_node_to_type(
     # Function Definitions - Try to reconstruct qualified name
     if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
         name = node.name
-        curr = node
-        while curr in parents:
-            curr = parents[curr]
+        for curr in reversed(ancestors):
             if isinstance(curr, (ast.ClassDef, ast.FunctionDef, ast.AsyncFunctionDef)):
                 name = f"{curr.name}.{name}"
         return name
@@ -288,12 +348,12 @@ def _build_inference_context(tree: ast.Module) -> InferenceContext:
                 if alias.asname:
                     context.aliases[alias.asname] = root
                 else:
-                    bound_name = root.split(".")[0]
+                    bound_name = root.partition(".")[0]
                     context.aliases[bound_name] = bound_name
         elif isinstance(node, ast.ImportFrom):
             if not node.module:
                 continue
-            module_root = node.module.split(".")[0]
+            module_root = node.module.partition(".")[0]
             context.aliases[module_root] = module_root
             for alias in node.names:
                 if alias.name == "*":
@@ -582,8 +642,8 @@ def _infer_pandas_groupby_return(owner: str, attr: str) -> str | None:
     if attr != "groupby":
         return None
 
-    owner_root = owner.split(".")[0]
-    owner_leaf = owner.split(".")[-1]
+    owner_root = owner.partition(".")[0]
+    owner_leaf = owner.rpartition(".")[2]
     if owner_root != "pandas":
         return None
 
@@ -607,8 +667,8 @@ def _infer_attribute(
     if not owner:
         return None
 
-    owner_root = owner.split(".")[0]
-    class_name = owner.split(".")[-1]
+    owner_root = owner.partition(".")[0]
+    class_name = owner.rpartition(".")[2]
     attr_map = context.class_attrs.get(class_name)
     if attr_map and node.attr in attr_map:
         return attr_map[node.attr]
@@ -1,37 +1,68 @@
 import ast
 import builtins
+import functools
 import importlib
-import importlib.util
 import inspect
-import io
 import keyword
-import os
-import pydoc
 import sys
+import types
+from collections import OrderedDict
+from operator import attrgetter
 
 SOFT_KEYWORDS = {"match", "case"}
 
+# None/True/False are keywords but also real objects, so they resolve
+# through builtins like any other name; every other keyword gets topic help.
+_KEYWORD_CONSTANTS = frozenset({"None", "True", "False"})
+_HELP_KEYWORDS = (frozenset(keyword.kwlist) | SOFT_KEYWORDS) - _KEYWORD_CONSTANTS
 
-def _resolve_keyword(symbol_name: str) -> dict | None:
-    """Handle Python keyword constants (None, True, False) and soft keywords."""
-    _KEYWORD_CONSTANTS = {"None", "True", "False"}
-    if symbol_name in _KEYWORD_CONSTANTS:
-        return None
+# Builtin modules plus every stdlib root the interpreter knows about, merged
+# once so _is_stdlib needs a single membership test.
+_STDLIB_ROOTS = frozenset(sys.builtin_module_names) | sys.stdlib_module_names
 
-    is_kw = keyword.iskeyword(symbol_name) or symbol_name in SOFT_KEYWORDS
-    if not is_kw:
-        return None
+# The builtins namespace itself: one dict probe instead of hasattr + getattr.
+_BUILTINS = vars(builtins)
+_MISSING = object()
 
-    capture = io.StringIO()
-    original_stdout = sys.stdout
-    sys.stdout = capture
-    try:
-        pydoc.help(symbol_name)
-    finally:
-        sys.stdout = original_stdout
+_PY_VERSION = f"{sys.version_info.major}.{sys.version_info.minor}"
+_DOCS_BASE = f"https://docs.python.org/{_PY_VERSION}/library"
+
+# Docs page per _url_kind. Top-level builtin classes (list, int) are indexed in
+# functions.html, nested ones in stdtypes.html and exceptions in
+# exceptions.html; anything else goes to its module's page.
+_URL_TEMPLATES = {
+    "exception": _DOCS_BASE + "/exceptions.html#{qualname}",
+    "type": _DOCS_BASE + "/functions.html#{qualname}",
+    "nested_type": _DOCS_BASE + "/stdtypes.html#{qualname}",
+    "module": _DOCS_BASE + "/{module}.html#{qualname}",
+}
+
+# Runtime docstrings longer than this are cut before they are sent to the
+# client. Big API docstrings (pandas.DataFrame.to_csv and friends) run past
+# 16 KB, so leave room for those and only stop truly runaway payloads.
+MAX_DOCSTRING_CHARS = 32 * 1024
+
+# Rendered pydoc help per keyword. The text is static for an interpreter, so it
+# is filled on first hover of each keyword and never evicted.
+_keyword_docs: dict[str, str] = {}
+
+# Entry cap shared by the resolve cache and the signature cache below.
+RESOLVE_CACHE_MAX = 4096
+
+# str(inspect.signature(obj)) keyed by id(obj), least recently used first. Each
+# entry also holds the object itself so its id can't be reused by another object
+# while cached. Failures are cached as None too, so builtins without a text
+# signature are only probed once.
+_signature_cache: OrderedDict[int, tuple[object, str | None]] = OrderedDict()
+
+
+def _resolve_keyword(symbol_name: str) -> dict | None:
+    """Handle Python keywords and soft keywords; constants resolve as objects."""
+    if symbol_name not in _HELP_KEYWORDS:
+        return None
 
     return {
-        "docstring": capture.getvalue(),
+        "docstring": _keyword_help(symbol_name),
         "signature": None,
         "module": "builtins",
         "qualname": symbol_name,
@@ -40,67 +71,187 @@ def _resolve_keyword(symbol_name: str) -> dict | None:
     }
 
 
+def _keyword_help(name: str) -> str:
+    """Return pydoc's help text for a keyword, rendering each keyword only once."""
+    text = _keyword_docs.get(name)
+    if text is None:
+        text = _keyword_docs[name] = _render_keyword_topic(name)
+    return text
+
+
+def _render_keyword_topic(name: str) -> str:
+    """
+    Build the text ``help(name)`` prints for a keyword straight from pydoc_data.
+
+    Mirrors ``pydoc.Helper.showtopic`` without going through its pager, which
+    writes to the process-wide sys.stdout. Keywords without a topic (the soft
+    keywords on older interpreters) get an empty docstring.
+    """
+    # pydoc drags in pkgutil, tokenize, platform, ... — only keywords need it,
+    # so don't pay for it at helper startup.
+    import pydoc
+
+    try:
+        from pydoc_data.topics import topics
+    except ImportError:
+        return ""
+
+    target = pydoc.Helper.keywords.get(name)
+    while isinstance(target, str):
+        target = pydoc.Helper.topics.get(target, pydoc.Helper.keywords.get(target))
+    if not target or target[0] not in topics:
+        return ""
+
+    label, xrefs = target
+    text = topics[label].strip() + "\n"
+    if xrefs:
+        import textwrap
+
+        related = "Related help topics: " + ", ".join(xrefs.split()) + "\n"
+        text += "\n%s\n" % "\n".join(textwrap.wrap(related, 72))
+    return text + "\n"
+
+
 def resolve_symbol(symbol_name):
     """
     Resolves a symbol to its documentation and metadata.
+
+    Successful results are memoized for the life of the helper process (a copy is
+    returned so callers can't mutate the cached entry). Failures are not cached,
+    so a module installed or created after a miss resolves on the next request.
     """
     try:
-        # Handle keywords first (None, True, False, match, case, etc.)
-        keyword_result = _resolve_keyword(symbol_name)
-        if keyword_result:
-            return keyword_result
-
-        # Try as a builtin
-        if hasattr(builtins, symbol_name):
-            obj = getattr(builtins, symbol_name)
-            return _describe(obj, "builtins", symbol_name)
-
-        # Strip 'builtins.' prefix if present (e.g. 'builtins.list.append')
-        short_name = symbol_name
-        if symbol_name.startswith("builtins."):
-            short_name = symbol_name[9:]
-            if hasattr(builtins, short_name):
-                obj = getattr(builtins, short_name)
-                return _describe(obj, "builtins", short_name)
-
-        parts = short_name.split(".")
-
-        # Strategy A: Try to find a module prefix (longest match first).
-        for i in range(len(parts), 0, -1):
-            module_path = ".".join(parts[:i])
-            remainder = parts[i:]
+        return dict(_resolve_cached(symbol_name))
+    except Exception as e:
+        return {"error": _error_message(e)}
+
+
+def resolve_symbols(symbol_names) -> dict[str, dict]:
+    """
+    Resolve several symbols in one call, returning results keyed by name.
+
+    Repeated names are resolved once. Modules are shared through sys.modules
+    and the resolve cache, so os.path.join and os.path.exists import os.path
+    only once between them.
+    """
+    return {name: resolve_symbol(name) for name in dict.fromkeys(symbol_names)}
 
-            try:
-                module = importlib.import_module(module_path)
-            except Exception:
-                continue
 
+def clear_caches() -> None:
+    """
+    Forget memoized resolve results so the next lookups re-import and re-inspect,
+    e.g. after the user installed packages or explicitly cleared caches.
+    """
+    _resolve_cached.cache_clear()
+    _signature_cache.clear()
+    importlib.invalidate_caches()
+
+
+def forget_failures() -> None:
+    """
+    Make sure modules that appeared since a failed lookup are found next time.
+
+    Failed resolves aren't memoized, but the import system caches directory
+    listings per path entry; invalidating them is cheap and keeps every
+    successful result cached, so this runs on each save and retry.
+    """
+    importlib.invalidate_caches()
+
+
+@functools.lru_cache(maxsize=RESOLVE_CACHE_MAX)
+def _resolve_cached(symbol_name: str) -> dict:
+    # Failures raise instead of returning an error dict: lru_cache only keeps
+    # returned values, so a miss is retried on the next hover.
+    # Handle keywords first (None, True, False, match, case, etc.)
+    keyword_result = _resolve_keyword(symbol_name)
+    if keyword_result:
+        return keyword_result
+
+    # Try as a builtin
+    obj = _BUILTINS.get(symbol_name, _MISSING)
+    if obj is not _MISSING:
+        return _describe(obj, "builtins", symbol_name)
+
+    # Strip 'builtins.' prefix if present (e.g. 'builtins.list.append')
+    short_name = symbol_name
+    if symbol_name.startswith("builtins."):
+        short_name = symbol_name[9:]
+        obj = _BUILTINS.get(short_name, _MISSING)
+        if obj is not _MISSING:
+            return _describe(obj, "builtins", short_name)
+
+    # A bare (non-builtin) name can only be a top-level module; skip the
+    # prefix walk and the builtin-attribute fallback below.
+    if "." not in short_name:
+        module = _import_module(short_name)
+        if module is None:
+            raise ImportError(f"Could not resolve {short_name}")
+        return _describe(module, short_name, short_name)
+
+    # Strategy A: Try to find a module prefix (longest match first), peeling
+    # one trailing component off the path per attempt. The attribute path
+    # is always the rest of short_name, so slice it rather than rebuild it.
+    module_path = short_name
+    while module_path:
+        module = _import_module(module_path)
+        if module is not None:
             try:
                 obj = module
-                for part in remainder:
-                    obj = getattr(obj, part)
+                if len(module_path) < len(short_name):
+                    obj = attrgetter(short_name[len(module_path) + 1 :])(obj)
                 return _describe(obj, module_path, short_name)
             except AttributeError:
                 pass
 
-        # Strategy B: Check if the root is a builtin (e.g. list.append).
-        if len(parts) > 1 and hasattr(builtins, parts[0]):
-            try:
-                obj = getattr(builtins, parts[0])
-                for part in parts[1:]:
-                    obj = getattr(obj, part)
-                return _describe(obj, "builtins", short_name)
-            except AttributeError:
-                pass
+        module_path = module_path.rpartition(".")[0]
+
+    # Strategy B: Check if the root is a builtin (e.g. list.append).
+    # attrgetter walks the dotted path in C, one call for the whole chain.
+    root_name, _, attr_path = short_name.partition(".")
+    root = _BUILTINS.get(root_name, _MISSING)
+    if root is not _MISSING:
+        try:
+            obj = attrgetter(attr_path)(root)
+            return _describe(obj, "builtins", short_name)
+        except AttributeError:
+            pass
 
-        raise ImportError(f"Could not resolve {short_name}")
+    raise ImportError(f"Could not resolve {short_name}")
 
-    except Exception as e:
-        return {"error": str(e)}
+
+def _error_message(e: Exception) -> str:
+    """
+    Describe a resolution failure without calling str() on it.
+
+    An exception's str() formats its args, which can embed the very object that
+    failed to resolve; a pathological __repr__ there would hang the helper.
+    """
+    message = e.args[0] if e.args else None
+    if isinstance(message, str):
+        return message
+    return type(e).__name__
+
+
+def _import_module(module_path: str):
+    """Import `module_path`, returning None if it can't be imported."""
+    # Already-imported modules are a dict hit; skip the import machinery.
+    # Failures are deliberately not remembered: a module created or installed
+    # mid-session must be found on the next hover.
+    module = sys.modules.get(module_path)
+    if module is not None:
+        return module
+    try:
+        return importlib.import_module(module_path)
+    except Exception:
+        return None
 
 
 def _describe(obj, module_name, name):
-    if inspect.ismodule(obj):
+    is_module = isinstance(obj, types.ModuleType)
+    is_type = isinstance(obj, type)
+    is_callable = callable(obj)
+
+    if is_module:
         defined_module = obj.__name__
     else:
         defined_module = getattr(obj, "__module__", None)
@@ -112,18 +263,24 @@ def _describe(obj, module_name, name):
     else:
         final_module = defined_module or module_name
 
-    docstring = inspect.getdoc(obj)
+    try:
+        docstring = inspect.getdoc(obj)
+    except Exception:
+        docstring = None
+    if docstring and len(docstring) > MAX_DOCSTRING_CHARS:
+        docstring = docstring[:MAX_DOCSTRING_CHARS].rstrip() + "\n\n…"
 
     # Discard docstring if it is the parent module's own docstring (not the object's).
     # This happens with typing aliases where __doc__ is not overridden per-symbol.
-    if docstring and not inspect.ismodule(obj) and module_name:
-        try:
-            parent_mod = importlib.import_module(module_name)
-            parent_doc = inspect.getdoc(parent_mod)
-            if parent_doc and docstring.strip() == parent_doc.strip():
-                docstring = None
-        except Exception:
-            pass
+    if docstring and not is_module and module_name:
+        parent_mod = _import_module(module_name)
+        if parent_mod is not None:
+            try:
+                parent_doc = inspect.getdoc(parent_mod)
+                if parent_doc and docstring.strip() == parent_doc.strip():
+                    docstring = None
+            except Exception:
+                pass
 
     try:
         # Suppress signatures for all typing module objects regardless of Python version.
@@ -133,18 +290,22 @@ def _describe(obj, module_name, name):
         # directly, we never want to show a callable signature for them.
         if getattr(obj, "__module__", None) == "typing":
             signature = None
-        elif callable(obj):
-            signature = str(inspect.signature(obj))
+        elif is_callable:
+            signature = _signature_of(obj)
         else:
             signature = None
     except (ValueError, TypeError):
         signature = None
 
-    url = (
-        _get_stdlib_url(final_module, getattr(obj, "__qualname__", name), obj)
-        if _is_stdlib(final_module)
-        else None
-    )
+    is_stdlib = _is_stdlib(final_module)
+    url = None
+    if is_stdlib:
+        url_qualname = str(getattr(obj, "__qualname__", name))
+        url = _get_stdlib_url(
+            final_module,
+            url_qualname,
+            _url_kind(obj, is_type, final_module, url_qualname),
+        )
 
     return {
         "docstring": docstring,
@@ -153,32 +314,58 @@ def _describe(obj, module_name, name):
         "qualname": getattr(
             obj, "__qualname__", name or getattr(obj, "__name__", str(obj))
         ),
-        "is_stdlib": _is_stdlib(final_module),
+        "is_stdlib": is_stdlib,
         "url": url,
     }
 
 
-def _get_stdlib_url(module_name, qualname, obj):
-    version = f"{sys.version_info.major}.{sys.version_info.minor}"
-    base = f"https://docs.python.org/{version}/library"
+def _signature_of(obj) -> str | None:
+    """Return the signature string for a callable, or None if it has none."""
+    cached = _signature_cache.get(id(obj))
+    if cached is not None:
+        _signature_cache.move_to_end(id(obj))
+        return cached[1]
 
-    if module_name == "builtins":
-        if inspect.isclass(obj) or isinstance(obj, type):
-            # Types like list, dict, int, str are in stdtypes.html
-            # Exceptions are in exceptions.html
-            if issubclass(obj, BaseException):
-                return f"{base}/exceptions.html#{qualname}"
-            # Builtin functions like len, print are in functions.html.
-            # But methods on builtin types (list.append) are in stdtypes.html.
-            if callable(obj):
-                return (
-                    f"{base}/stdtypes.html#{qualname}"
-                    if "." in qualname
-                    else f"{base}/functions.html#{qualname}"
-                )
+    try:
+        signature = str(inspect.signature(obj))
+    except (ValueError, TypeError):
+        signature = None
 
-    # Standard library modules.
-    return f"{base}/{module_name}.html#{qualname}"
+    if not _is_bound_to_instance(obj):
+        _signature_cache[id(obj)] = (obj, signature)
+        if len(_signature_cache) > RESOLVE_CACHE_MAX:
+            _signature_cache.popitem(last=False)
+    return signature
+
+
+def _is_bound_to_instance(obj) -> bool:
+    """
+    True for methods bound to an instance, e.g. sys.stdout.write.
+
+    Attribute access builds a fresh bound method every time, so caching one by id
+    would only pin an object no later lookup can hit. Builtin functions are
+    "bound" to their module (len.__self__ is builtins) and are still cached.
+    """
+    if inspect.ismethod(obj):
+        return True
+    return isinstance(obj, types.BuiltinMethodType) and not isinstance(
+        obj.__self__, types.ModuleType
+    )
+
+
+def _url_kind(obj, is_type: bool, module_name: str, qualname: str) -> str:
+    """Pick the _URL_TEMPLATES entry for `obj`, given where it was found."""
+    # Only builtin classes are split across pages; everything else lives on
+    # its module's page.
+    if module_name != "builtins" or not is_type:
+        return "module"
+    if issubclass(obj, BaseException):
+        return "exception"
+    return "nested_type" if "." in qualname else "type"
+
+
+def _get_stdlib_url(module_name: str, qualname: str, kind: str) -> str:
+    return _URL_TEMPLATES[kind].format(module=module_name, qualname=qualname)
 
 
 def get_docstring_from_source(source: str, symbol_name: str) -> dict:
@@ -354,31 +541,4 @@ def _ast_signature(node) -> str | None:
 def _is_stdlib(module_name):
     if not module_name:
         return False
-
-    root_pkg = module_name.split(".")[0]
-
-    if root_pkg in sys.builtin_module_names:
-        return True
-
-    if hasattr(sys, "stdlib_module_names"):
-        return root_pkg in sys.stdlib_module_names
-
-    # Fallback for older Python versions
-    try:
-        spec = importlib.util.find_spec(root_pkg)
-        if spec is None or spec.origin is None:
-            return False
-
-        # If it's in site-packages, it's definitely 3rd party
-        origin = spec.origin.lower()
-        if "site-packages" in origin or "dist-packages" in origin:
-            return False
-
-        # If it lives in the standard library path
-        lib_path = os.path.dirname(os.__file__).lower()
-        if origin.startswith(lib_path):
-            return True
-
-        return False
-    except Exception:
-        return False
+    return module_name.partition(".")[0] in _STDLIB_ROOTS
@@ -26,6 +26,8 @@ type ResolveSourceSymbolRequest = {
 };
 type VersionInfoRequest = { cmd: "version_info" };
 type PackageVersionRequest = { cmd: "pkg_version"; package: string };
+type ClearCacheRequest = { cmd: "clear_cache" };
+type ForgetFailuresRequest = { cmd: "forget_failures" };
 
 type PythonServerCommand =
   | ResolveRequest
@@ -33,7 +35,9 @@ type PythonServerCommand =
   | GetDocstringRequest
   | ResolveSourceSymbolRequest
   | VersionInfoRequest
-  | PackageVersionRequest;
+  | PackageVersionRequest
+  | ClearCacheRequest
+  | ForgetFailuresRequest;
 
 interface PythonHelperErrorResult {
   error: string;
@@ -63,6 +67,8 @@ interface PythonCommandResultMap {
   resolve_source_symbol: SourceSymbolResult;
   version_info: VersionInfoResult;
   pkg_version: PackageVersionResult;
+  clear_cache: null;
+  forget_failures: null;
 }
 
 type PythonCommandName = keyof PythonCommandResultMap;
@@ -71,6 +77,8 @@ type PythonCommandFor<T extends PythonCommandName> = Extract<
   { cmd: T }
 >;
 
+type QueuedRequest = { id: number } & PythonServerCommand;
+
 interface PendingRequest {
   resolve: (value: unknown) => void;
   reject: (reason: unknown) => void;
@@ -83,7 +91,12 @@ interface PendingRequest {
  *
  * Protocol: newline-delimited JSON over stdin/stdout.
  *   Request:  {"id": N, "cmd": "resolve"|"identify"|"version_info", ...args}
+ *   Batch:    {"cmd": "batch", "requests": [<request>, ...]}
  *   Response: {"id": N, "result": ...} | {"id": N, "error": "..."}
+ *
+ * Requests issued in the same tick (e.g. the identify + resolve calls of one
+ * hover) are coalesced into a single batch line; the server still answers each
+ * one on its own line by id, so response handling is unchanged.
  */
 class PythonProcess {
   private proc: cp.ChildProcess | null = null;
@@ -91,6 +104,8 @@ class PythonProcess {
   private nextId = 0;
   private buffer = "";
   private dead = false;
+  private outbox: QueuedRequest[] = [];
+  private flushScheduled = false;
 
   constructor(
     private readonly pythonPath: string,
@@ -109,9 +124,10 @@ class PythonProcess {
         stdio: ["pipe", "pipe", "pipe"],
       });
 
-      this.proc.stdout!.on("data", (chunk: Buffer) =>
-        this.onData(chunk.toString()),
-      );
+      // The helper may emit raw UTF-8 (orjson does), so let the stream decode
+      // — a multi-byte character can straddle two chunks.
+      this.proc.stdout!.setEncoding("utf8");
+      this.proc.stdout!.on("data", (chunk: string) => this.onData(chunk));
 
       this.proc.stderr!.on("data", (data: Buffer) => {
         const msg = data.toString().trim();
@@ -212,16 +228,42 @@ class PythonProcess {
         timer,
       });
 
-      try {
-        this.proc.stdin!.write(JSON.stringify({ id, ...cmd }) + "\n");
-      } catch (e) {
-        clearTimeout(timer);
-        this.pending.delete(id);
-        reject(e);
+      this.outbox.push({ id, ...cmd } as QueuedRequest);
+      if (!this.flushScheduled) {
+        this.flushScheduled = true;
+        setImmediate(() => this.flush());
       }
     });
   }
 
+  /** Write every request queued this tick — alone, or as one batch line. */
+  private flush(): void {
+    this.flushScheduled = false;
+    const queued = this.outbox;
+    this.outbox = [];
+    if (queued.length === 0 || !this.proc || this.dead) {
+      // handleDeath() has already rejected anything still pending.
+      return;
+    }
+
+    const line =
+      queued.length === 1
+        ? JSON.stringify(queued[0])
+        : JSON.stringify({ cmd: "batch", requests: queued });
+    try {
+      this.proc.stdin!.write(line + "\n");
+    } catch (e) {
+      for (const request of queued) {
+        const pending = this.pending.get(request.id);
+        if (pending) {
+          clearTimeout(pending.timer);
+          this.pending.delete(request.id);
+          pending.reject(e);
+        }
+      }
+    }
+  }
+
   isAlive(): boolean {
     return !this.dead && this.proc !== null;
   }
@@ -549,8 +591,9 @@ export class PythonHelper {
             resolve(null);
           }, 2000);
 
-          proc.stdout?.on("data", (d: Buffer) => {
-            out += d.toString();
+          proc.stdout?.setEncoding("utf8");
+          proc.stdout?.on("data", (d: string) => {
+            out += d;
           });
 
           proc.on("error", () => {
@@ -815,6 +858,30 @@ export class PythonHelper {
     this.sessionCache.clear();
   }
 
+  /** Drop the helper process's memoized resolve results without restarting it.
+   *  A no-op when the helper isn't running — a fresh process starts empty anyway. */
+  clearRuntimeCache(): void {
+    if (!this.process || !this.process.isAlive()) {
+      return;
+    }
+    void this.send({ cmd: "clear_cache" }, 2000);
+  }
+
+  /** Let runtime misses be asked again (save, hover Retry) while keeping every
+   *  successful result: drops the `null` session entries and has the helper
+   *  invalidate its import finder caches so newly created/installed modules show up. */
+  forgetRuntimeFailures(): void {
+    for (const [symbol, info] of this.sessionCache) {
+      if (info === null) {
+        this.sessionCache.delete(symbol);
+      }
+    }
+    if (!this.process || !this.process.isAlive()) {
+      return;
+    }
+    void this.send({ cmd: "forget_failures" }, 2000);
+  }
+
   dispose(): void {
     if (this.process) {
       this.process.dispose();
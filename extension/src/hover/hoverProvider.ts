@@ -596,6 +596,8 @@ export class HoverProvider implements vscode.HoverProvider {
     // command tokens in already-rendered hovers must remain valid after a
     // document save so the user can still act on them without re-hovering.
     this.pythonHelper.clearSessionCache();
+    this.pythonHelper.clearRuntimeCache();
+    this.resolutionManager.forgetRuntimeMisses();
     this.diagnosticCollection?.clear();
     this.deprecatedRanges.clear();
     this.sessionState.fireSidebarDidChange();
@@ -608,6 +610,9 @@ export class HoverProvider implements vscode.HoverProvider {
   retryHover(commandToken: string): void {
     this.hoverCache.delete(commandToken);
     this.negativeHoverCache.delete(commandToken);
+    // The miss may also be cached as a runtime `null`; let it be asked again.
+    this.resolutionManager.forgetRuntimeMisses();
+    this.pythonHelper.forgetRuntimeFailures();
   }
 
   /** Clear caches related to a single document (keeps global caches intact). */
@@ -654,6 +659,8 @@ export class HoverProvider implements vscode.HoverProvider {
     // to preserve cross-document performance.
     this.parameterLensService.clearSessionCache();
     this.pythonHelper.clearSessionCache();
+    this.resolutionManager.forgetRuntimeMisses();
+    this.pythonHelper.forgetRuntimeFailures();
     this.sessionState.fireSidebarDidChange();
   }
 
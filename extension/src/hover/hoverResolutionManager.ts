@@ -13,6 +13,15 @@ export class HoverResolutionManager {
     private pythonHelper: PythonHelper | null,
   ) {}
 
+  /** Drop cached runtime misses so the next lookup asks the Python helper again. */
+  forgetRuntimeMisses(): void {
+    for (const [key, doc] of this.runtimeDocCache) {
+      if (doc === null) {
+        this.runtimeDocCache.delete(key);
+      }
+    }
+  }
+
   async resolveDoc(
     key: DocKey,
     fetchInstalledVersionForPkg?: string,
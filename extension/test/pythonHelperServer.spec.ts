@@ -0,0 +1,178 @@
+import assert from "node:assert/strict";
+import * as cp from "node:child_process";
+import * as fs from "node:fs";
+import * as os from "node:os";
+import * as path from "node:path";
+import { after, before, describe, it } from "node:test";
+
+const HELPER = path.resolve(__dirname, "../python-helper/helper.py");
+const PYTHON = process.env.PYTHON || (process.platform === "win32" ? "python" : "python3");
+
+type Response = { id: number; result?: any; error?: string };
+
+/** Minimal driver for `helper.py --server`: one JSON line in, response lines out by id. */
+class HelperServer {
+  private proc: cp.ChildProcessWithoutNullStreams;
+  private buffer = "";
+  private waiters = new Map<number, (res: Response) => void>();
+  readonly arrivals: number[] = [];
+
+  constructor(env: NodeJS.ProcessEnv) {
+    this.proc = cp.spawn(PYTHON, [HELPER, "--server"], { env });
+    this.proc.stdout.setEncoding("utf8");
+    this.proc.stdout.on("data", (chunk: string) => {
+      this.buffer += chunk;
+      let newline: number;
+      while ((newline = this.buffer.indexOf("\n")) !== -1) {
+        const line = this.buffer.slice(0, newline);
+        this.buffer = this.buffer.slice(newline + 1);
+        if (!line.trim()) continue;
+        const res = JSON.parse(line) as Response;
+        this.arrivals.push(res.id);
+        this.waiters.get(res.id)?.(res);
+        this.waiters.delete(res.id);
+      }
+    });
+  }
+
+  writeLine(payload: unknown): void {
+    this.proc.stdin.write(JSON.stringify(payload) + "\n");
+  }
+
+  waitFor(id: number): Promise<Response> {
+    return new Promise((resolve) => this.waiters.set(id, resolve));
+  }
+
+  close(): void {
+    this.proc.stdin.end();
+    this.proc.kill();
+  }
+}
+
+describe("python helper server", () => {
+  let tmpDir: string;
+  let server: HelperServer;
+
+  before(() => {
+    // A module whose import is deliberately slow, standing in for a cold
+    // import of a heavy library.
+    tmpDir = fs.mkdtempSync(path.join(os.tmpdir(), "pyhover-helper-"));
+    fs.writeFileSync(
+      path.join(tmpDir, "slow_import_mod.py"),
+      "import time\ntime.sleep(1.5)\n\ndef f():\n    \"\"\"Slow module function.\"\"\"\n",
+    );
+    // A lone surrogate, as surrogateescape-decoded text can leave behind.
+    fs.writeFileSync(
+      path.join(tmpDir, "surrogate_doc_mod.py"),
+      "def f():\n    pass\n\nf.__doc__ = \"bad \\ud800 doc\"\n",
+    );
+    server = new HelperServer({
+      ...process.env,
+      PYTHONPATH: [tmpDir, process.env.PYTHONPATH].filter(Boolean).join(path.delimiter),
+    });
+  });
+
+  after(() => {
+    server.close();
+    fs.rmSync(tmpDir, { recursive: true, force: true });
+  });
+
+  it("answers a single request by id", async () => {
+    const pending = server.waitFor(1);
+    server.writeLine({ id: 1, cmd: "resolve", symbol: "len" });
+    const res = await pending;
+    assert.equal(res.result.qualname, "len");
+    assert.equal(res.result.module, "builtins");
+  });
+
+  it("resolves several symbols with resolve_many, keyed by name", async () => {
+    const pending = server.waitFor(7);
+    server.writeLine({ id: 7, cmd: "resolve_many", symbols: ["len", "os.path.join", "len"] });
+    const res = await pending;
+    assert.deepEqual(Object.keys(res.result), ["len", "os.path.join"]);
+    assert.equal(res.result["os.path.join"].qualname, "join");
+  });
+
+  it("retries a failed resolve once the module exists", async () => {
+    const missing = server.waitFor(8);
+    server.writeLine({ id: 8, cmd: "resolve", symbol: "late_mod.f" });
+    assert.equal((await missing).result.error, "Could not resolve late_mod.f");
+
+    // As if the user created the module (or pip-installed a package) mid-session.
+    fs.writeFileSync(path.join(tmpDir, "late_mod.py"), "def f():\n    \"\"\"Late.\"\"\"\n");
+    const found = server.waitFor(9);
+    server.writeLine({ id: 9, cmd: "resolve", symbol: "late_mod.f" });
+    assert.equal((await found).result.docstring, "Late.");
+  });
+
+  it("acknowledges forget_failures without dropping successful results", async () => {
+    const ack = server.waitFor(10);
+    server.writeLine({ id: 10, cmd: "forget_failures" });
+    assert.deepEqual(await ack, { id: 10, result: null });
+
+    const again = server.waitFor(11);
+    server.writeLine({ id: 11, cmd: "resolve", symbol: "late_mod.f" });
+    assert.equal((await again).result.docstring, "Late.");
+  });
+
+  it("encodes docstrings containing lone surrogates", async () => {
+    const pending = server.waitFor(6);
+    server.writeLine({ id: 6, cmd: "resolve", symbol: "surrogate_doc_mod.f" });
+    const res = await pending;
+    assert.equal(res.error, undefined);
+    assert.equal(res.result.docstring, "bad \ud800 doc");
+  });
+
+  it("decodes batch lines carrying unpaired UTF-16 surrogates", async () => {
+    // JSON.stringify escapes a lone surrogate as "\ud800"; the line must still
+    // parse so each request in it gets its own answer instead of one id-0 error.
+    const pending = [server.waitFor(12), server.waitFor(13)];
+    server.writeLine({
+      cmd: "batch",
+      requests: [
+        { id: 12, cmd: "identify", source: 's = "\ud800"\nx = [1]\n', line: 2, col: 4 },
+        { id: 13, cmd: "resolve", symbol: "len" },
+      ],
+    });
+    const [identify, resolve] = await Promise.all(pending);
+    assert.equal(identify.id, 12);
+    assert.equal(resolve.result.qualname, "len");
+  });
+
+  it("answers every request in a batch on its own line", async () => {
+    const pending = [server.waitFor(2), server.waitFor(3)];
+    server.writeLine({
+      cmd: "batch",
+      requests: [
+        { id: 2, cmd: "identify", source: "x = [1]\n", line: 1, col: 0 },
+        { id: 3, cmd: "resolve", symbol: "os.path.join" },
+      ],
+    });
+    const [identify, resolve] = await Promise.all(pending);
+    assert.equal(identify.result.type, "list");
+    assert.equal(resolve.result.qualname, "join");
+  });
+
+  it("writes each batch answer as soon as it is ready", async () => {
+    const start = Date.now();
+    const fast = server.waitFor(4).then((res) => ({ res, elapsed: Date.now() - start }));
+    const slow = server.waitFor(5);
+    server.writeLine({
+      cmd: "batch",
+      requests: [
+        { id: 4, cmd: "identify", source: "x = [1]\n", line: 1, col: 0 },
+        { id: 5, cmd: "resolve", symbol: "slow_import_mod.f" },
+      ],
+    });
+
+    // identify() gives up after 1000ms; it must not wait for the slow import
+    // that happens to share its batch line.
+    const { res, elapsed } = await fast;
+    assert.equal(res.result.type, "list");
+    assert.ok(elapsed < 1000, `identify answered after ${elapsed}ms`);
+
+    const slowRes = await slow;
+    assert.equal(slowRes.result.docstring, "Slow module function.");
+    assert.deepEqual(server.arrivals.slice(-2), [4, 5]);
+  });
+});